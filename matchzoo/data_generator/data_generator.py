@@ -5,8 +5,38 @@ import typing
 
 import keras
 import numpy as np
+import pandas as pd
 
 from matchzoo import DataPack
+from matchzoo.utils import get_row_positions
+
+
+def _stack_column(
+    column: typing.Union[pd.Series, pd.Index]
+) -> np.ndarray:
+    """Stack the cells of `column` into a single array, row by row."""
+    values = column.tolist()
+    if values and isinstance(values[0], str):
+        # Keep references to the strings instead of a fixed width copy.
+        return np.array(values, dtype=object)
+    try:
+        array = np.array(values)
+    except ValueError:
+        # Ragged cells (e.g. unpadded token lists) are kept as objects.
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+    if array.ndim == 2 and array.dtype.kind in 'iu' and _fits_int32(array):
+        # Fixed length term index sequences, copied row by row per batch.
+        array = np.ascontiguousarray(array, dtype=np.int32)
+    return array
+
+
+def _fits_int32(array: np.ndarray) -> bool:
+    """Check whether every value of `array` is representable as int32."""
+    int32 = np.iinfo(np.int32)
+    return array.size == 0 or (
+        int32.min <= array.min() and array.max() <= int32.max)
 
 
 class DataGenerator(keras.utils.Sequence):
@@ -60,6 +90,8 @@ class DataGenerator(keras.utils.Sequence):
         self._batch_size = batch_size
         self._shuffle = shuffle
 
+        self._build_arrays()
+
         self._batch_indices = None
         self._set_indices()
 
@@ -69,7 +101,7 @@ class DataGenerator(keras.utils.Sequence):
         :param item: the index of the batch.
         """
         if isinstance(item, slice):
-            indices = sum(self._batch_indices[item], [])
+            indices = np.concatenate(self._batch_indices[item])
         else:
             indices = self._batch_indices[item]
         return self._get_batch_of_transformed_samples(indices)
@@ -83,7 +115,62 @@ class DataGenerator(keras.utils.Sequence):
         :param indices: a list of instance ids.
         :return: A batch of transformed samples.
         """
-        return self._data_pack[indices].unpack()
+        return self._gather(np.asarray(indices))
+
+    def _build_arrays(self):
+        """
+        Store the columns of :attr:`_data_pack` as separate arrays.
+
+        Relation ids are encoded as row positions of the left and right
+        frames, so :meth:`_gather` builds a batch from integer gathers only.
+        """
+        relation = self._data_pack.relation
+        left = self._data_pack.left
+        right = self._data_pack.right
+        self._left_rows = get_row_positions(left.index, relation['id_left'])
+        self._right_rows = get_row_positions(right.index, relation['id_right'])
+        if self._data_pack.has_label:
+            self._label_arr = np.vstack(np.asarray(relation['label']))
+            if self._label_arr.dtype == np.float64:
+                # Targets are consumed as float32 by the models anyway.
+                self._label_arr = self._label_arr.astype(np.float32)
+        else:
+            self._label_arr = None
+        self._relation_arrays = {
+            column: _stack_column(relation[column])
+            for column in relation.columns
+            if column not in ('id_left', 'id_right', 'label')}
+        self._left_ids = _stack_column(left.index)
+        self._right_ids = _stack_column(right.index)
+        self._left_arrays = {
+            column: _stack_column(left[column]) for column in left.columns}
+        self._right_arrays = {
+            column: _stack_column(right[column]) for column in right.columns}
+
+    def _gather(self, rows: np.array) -> typing.Tuple[dict, typing.Any]:
+        """
+        Gather the instances at relation positions `rows` as a batch.
+
+        :param rows: positions in the relation of :attr:`_data_pack`.
+        :return: A tuple of (X, y), laid out as :meth:`DataPack.unpack`.
+        """
+        left_rows = self._left_rows[rows]
+        right_rows = self._right_rows[rows]
+
+        x = {'id_left': self._left_ids[left_rows]}
+        for column, array in self._left_arrays.items():
+            x[column] = array[left_rows]
+        x['id_right'] = self._right_ids[right_rows]
+        for column, array in self._right_arrays.items():
+            x[column] = array[right_rows]
+        for column, array in self._relation_arrays.items():
+            x[column] = array[rows]
+
+        if self._label_arr is not None:
+            y = self._label_arr[rows]
+        else:
+            y = None
+        return x, y
 
     def __len__(self) -> int:
         """Get the total number of batches."""
@@ -107,11 +194,13 @@ class DataGenerator(keras.utils.Sequence):
         Set the :attr:`index_array`.
 
         Here the :attr:`index_array` records the index of all the instances.
+        Batches are views of a single index array, so they are passed to
+        :meth:`_get_batch_of_transformed_samples` without any conversion.
         """
         if self._shuffle:
-            index_pool = np.random.permutation(self.num_instance).tolist()
+            index_pool = np.random.permutation(self.num_instance)
         else:
-            index_pool = list(range(self.num_instance))
+            index_pool = np.arange(self.num_instance)
         self._batch_indices = []
         for i in range(len(self) - 1):
             lower = self._batch_size * i
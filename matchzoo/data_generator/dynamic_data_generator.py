@@ -38,6 +38,9 @@ class DynamicDataGenerator(DataGenerator):
         super().__init__(*args, **kwargs)
         self._func = func
 
+    def _build_arrays(self):
+        """Skip the column arrays, batches are transformed on the fly."""
+
     def _get_batch_of_transformed_samples(self, indices: np.array):
         """
         Get a batch of samples based on their ids.
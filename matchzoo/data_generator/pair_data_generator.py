@@ -3,10 +3,62 @@
 import math
 
 import numpy as np
-import pandas as pd
 
 from matchzoo.data_pack import DataPack
 from matchzoo.data_generator import DataGenerator
+from matchzoo.utils import get_row_positions
+
+
+def _segment_ends(is_start: np.ndarray) -> np.ndarray:
+    """Get the (exclusive) end of the segment each position belongs to."""
+    starts = np.flatnonzero(is_start)
+    ends = np.empty_like(starts)
+    ends[:-1] = starts[1:]
+    ends[-1:] = len(is_start)
+    return np.repeat(ends, ends - starts)
+
+
+def _build_pairs(group_ids: np.ndarray, labels: np.ndarray,
+                 num_dup: int = 1, num_neg: int = 1) -> np.ndarray:
+    """
+    Sample pair-wise rows for all groups at once.
+
+    Rows are sorted by group and then by descending label, so the negative
+    pool of a row is the contiguous range between the end of its label run
+    and the end of its group. Every row with a non-empty pool is a positive
+    sample, and negatives are drawn from the pool with replacement.
+
+    :param group_ids: group (i.e. `id_left`) of each row.
+    :param labels: label of each row.
+    :param num_dup: number of duplicates for each positive sample.
+    :param num_neg: number of negative samples associated with each
+        positive sample.
+    :return: positions of the paired rows, shaped as `(num_pairs,
+        num_neg + 1)` with the positive sample in the first column.
+    """
+    # Sort on label ranks, negating bool or unsigned labels is not safe.
+    _, label_ranks = np.unique(labels, return_inverse=True)
+    order = np.lexsort((-label_ranks, group_ids))
+    group_ids = group_ids[order]
+    labels = labels[order]
+
+    is_group_start = np.ones(len(order), dtype=bool)
+    is_group_start[1:] = group_ids[1:] != group_ids[:-1]
+    is_run_start = is_group_start.copy()
+    is_run_start[1:] |= labels[1:] != labels[:-1]
+    group_end = _segment_ends(is_group_start)
+    run_end = _segment_ends(is_run_start)
+
+    pos_rows = np.tile(np.flatnonzero(run_end < group_end), num_dup)
+    neg_start = run_end[pos_rows]
+    neg_count = group_end[pos_rows] - neg_start
+    offsets = np.random.random_sample((len(pos_rows), num_neg))
+    offsets = (offsets * neg_count[:, np.newaxis]).astype(np.int64)
+
+    pairs = np.empty((len(pos_rows), num_neg + 1), dtype=np.int64)
+    pairs[:, 0] = pos_rows
+    pairs[:, 1:] = neg_start[:, np.newaxis] + offsets
+    return order[pairs]
 
 
 class PairDataGenerator(DataGenerator):
@@ -66,11 +118,9 @@ class PairDataGenerator(DataGenerator):
 
     def _get_batch_of_transformed_samples(self, indices: np.array):
         """Get a batch of paired instances."""
-        paired_indices = []
-        for index in indices:
-            paired_indices.extend(
-                range(index * self._steps, (index + 1) * self._steps))
-        return self._data_pack[paired_indices].unpack()
+        indices = np.asarray(indices)[:, np.newaxis]
+        trans_index = (indices * self._steps + np.arange(self._steps)).ravel()
+        return self._gather(trans_index)
 
     @classmethod
     def reorganize_data_pack(cls, data_pack: DataPack, num_dup: int = 1,
@@ -83,20 +133,13 @@ class PairDataGenerator(DataGenerator):
             positive sample.
         :return: the reorganized :class:`DataPack` object.
         """
-        pairs = []
-        groups = data_pack.relation.sort_values(
-            'label', ascending=False).groupby('id_left')
-        for idx, group in groups:
-            labels = group.label.unique()
-            for label in labels[:-1]:
-                pos_samples = group[group.label == label]
-                pos_samples = pd.concat([pos_samples] * num_dup)
-                neg_samples = group[group.label < label]
-                for _, pos_sample in pos_samples.iterrows():
-                    pos_sample = pd.DataFrame([pos_sample])
-                    neg_sample = neg_samples.sample(num_neg, replace=True)
-                    pairs.extend((pos_sample, neg_sample))
-        new_relation = pd.concat(pairs, ignore_index=True)
+        relation = data_pack.relation
+        group_ids = get_row_positions(data_pack.left.index,
+                                      relation['id_left'])
+        pairs = _build_pairs(group_ids, relation['label'].values,
+                             num_dup, num_neg)
+        new_relation = relation.iloc[pairs.ravel()]
+        new_relation.reset_index(drop=True, inplace=True)
         return DataPack(relation=new_relation,
                         left=data_pack.left.copy(),
                         right=data_pack.right.copy())
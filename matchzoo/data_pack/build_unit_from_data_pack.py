@@ -1,5 +1,8 @@
 """Build unit from data pack."""
 
+import itertools
+import typing
+
 from tqdm import tqdm
 
 from matchzoo import processor_units
@@ -25,14 +28,33 @@ def build_unit_from_data_pack(
     :return: A built :class:`StatefulProcessorUnit` object.
 
     """
-    corpus = []
+    texts = iter_texts(data_pack, mode)
     if flatten:
-        data_pack.apply_on_text(corpus.extend, mode=mode, verbose=verbose)
+        corpus = list(itertools.chain.from_iterable(texts))
     else:
-        data_pack.apply_on_text(corpus.append, mode=mode, verbose=verbose)
+        corpus = list(texts)
     if verbose:
         description = 'Building ' + unit.__class__.__name__ + \
                       ' from a datapack.'
         corpus = tqdm(corpus, desc=description)
     unit.fit(corpus)
     return unit
+
+
+def iter_texts(data_pack: DataPack, mode: str = 'both') -> typing.Iterator:
+    """
+    Iterate over the texts of `data_pack` without copying them.
+
+    :param data_pack: The input :class:`DataPack` object.
+    :param mode: One of 'left', 'right', and 'both', to determine the source
+            texts.
+    :return: An iterator over `text_left` and/or `text_right` values.
+    """
+    if mode not in ('both', 'left', 'right'):
+        raise ValueError("`mode` must be one of `left` `right` `both`.")
+    columns = []
+    if mode in ('both', 'left'):
+        columns.append(data_pack.left['text_left'].values)
+    if mode in ('both', 'right'):
+        columns.append(data_pack.right['text_right'].values)
+    return itertools.chain.from_iterable(columns)
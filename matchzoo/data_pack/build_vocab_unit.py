@@ -1,7 +1,12 @@
 """Build a :class:`processor_units.VocabularyUnit` given `data_pack`."""
+import collections
+import itertools
+
+from tqdm import tqdm
+
 from matchzoo import processor_units
 from . import DataPack
-from . import build_unit_from_data_pack
+from .build_unit_from_data_pack import iter_texts
 
 
 def build_vocab_unit(
@@ -23,5 +28,10 @@ def build_vocab_unit(
     :return: A built vocabulary unit.
 
     """
-    return build_unit_from_data_pack(processor_units.VocabularyUnit(),
-                                     data_pack, mode, True, verbose)
+    texts = iter_texts(data_pack, mode)
+    if verbose:
+        texts = tqdm(texts, desc='Building VocabularyUnit from a datapack.')
+    vocab = collections.Counter(itertools.chain.from_iterable(texts))
+    vocab_unit = processor_units.VocabularyUnit()
+    vocab_unit.fit(vocab)
+    return vocab_unit
@@ -12,8 +12,6 @@ import pandas as pd
 
 import matchzoo
 
-tqdm.pandas()
-
 
 def _convert_to_list_index(
     index: typing.Union[int, slice, np.array],
@@ -26,6 +24,21 @@ def _convert_to_list_index(
     return index
 
 
+def _apply_on_column(
+    column: pd.Series,
+    func: typing.Callable,
+    verbose: int = 1,
+    desc: typing.Optional[str] = None
+) -> pd.Series:
+    """Apply `func` on every value of `column`."""
+    if not verbose:
+        return column.apply(func)
+    # Iterate over the raw values so the progress bar only refreshes every
+    # `mininterval` seconds instead of hooking into every pandas call.
+    values = tqdm(column.values, desc=desc, mininterval=1.0)
+    return pd.Series([func(value) for value in values], index=column.index)
+
+
 class DataPack(object):
     """
     Matchzoo :class:`DataPack` data structure, store dataframe and context.
@@ -379,19 +392,15 @@ class DataPack(object):
 
     def _apply_on_text_right(self, func, rename, verbose=1):
         name = rename or 'text_right'
-        if verbose:
-            tqdm.pandas(desc="Processing " + name + " with " + func.__name__)
-            self._right[name] = self._right['text_right'].progress_apply(func)
-        else:
-            self._right[name] = self._right['text_right'].apply(func)
+        self._right[name] = _apply_on_column(
+            self._right['text_right'], func, verbose=verbose,
+            desc="Processing " + name + " with " + func.__name__)
 
     def _apply_on_text_left(self, func, rename, verbose=1):
         name = rename or 'text_left'
-        if verbose:
-            tqdm.pandas(desc="Processing " + name + " with " + func.__name__)
-            self._left[name] = self._left['text_left'].progress_apply(func)
-        else:
-            self._left[name] = self._left['text_left'].apply(func)
+        self._left[name] = _apply_on_column(
+            self._left['text_left'], func, verbose=verbose,
+            desc="Processing " + name + " with " + func.__name__)
 
     def _apply_on_text_both(self, func, rename, verbose=1):
         left_name, right_name = rename or ('text_left', 'text_right')
@@ -44,7 +44,8 @@ def load_data(stage: str = 'train',
     if isinstance(task, matchzoo.tasks.Ranking):
         if target_label not in ['entailment', 'contradiction', 'neutral', '-']:
             raise ValueError
-        binary = (data_pack.relation['label'] == target_label).astype(float)
+        binary = (data_pack.relation['label'] == target_label).astype(
+            'float32')
         data_pack.relation['label'] = binary
         return data_pack
     elif isinstance(task, matchzoo.tasks.Classification):
@@ -50,6 +50,8 @@ def load_data(stage: str = 'train', task: str = 'ranking', filter: str = False
         task = matchzoo.tasks.Classification()
 
     if isinstance(task, matchzoo.tasks.Ranking):
+        data_pack.relation['label'] = \
+            data_pack.relation['label'].astype('float32')
         return data_pack
     elif isinstance(task, matchzoo.tasks.Classification):
         data_pack.one_hot_encode_label(task.num_classes, inplace=True)
@@ -76,10 +76,16 @@ class Embedding(object):
         for index in np.ndindex(*matrix.shape):
             matrix[index] = initializer()
 
-        valid_keys = set(self._data.index)
-        for term, index in term_index.items():
-            if term in valid_keys:
-                matrix[index] = self._data.loc[term]
+        terms = list(term_index.keys())
+        indices = np.fromiter(term_index.values(), dtype=np.int64,
+                              count=len(terms))
+        # Terms parsed as NaN (e.g. "nan", "null") may repeat in the index,
+        # so only the first occurrence of each term is looked up.
+        is_first = ~self._data.index.duplicated()
+        rows = self._data.index[is_first].get_indexer(terms)
+        found = rows != -1
+        rows = np.flatnonzero(is_first)[rows[found]]
+        matrix[indices[found]] = self._data.values[rows]
 
         return matrix
 
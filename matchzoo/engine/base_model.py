@@ -241,6 +241,8 @@ class BaseModel(abc.ABC):
         generator: DataGenerator,
         epochs: int = 1,
         verbose: int = 1,
+        workers: int = 1,
+        use_multiprocessing: bool = False,
         **kwargs
     ) -> keras.callbacks.History:
         """
@@ -253,6 +255,12 @@ class BaseModel(abc.ABC):
         :param epochs: Number of epochs to train the model.
         :param verbose: 0, 1, or 2. Verbosity mode. 0 = silent, 1 = verbose,
             2 = one log line per epoch.
+        :param workers: Number of workers preparing batches. Same as the
+            keras default, batches are already prefetched on one background
+            worker. Raise it only if the generator (e.g. the `func` of a
+            :class:`DynamicDataGenerator`) is safe to call concurrently.
+        :param use_multiprocessing: `True` to use processes instead of
+            threads as workers, same default as keras.
 
         :return: A `keras.callbacks.History` instance. Its history attribute
             contains all information collected during training.
@@ -260,7 +268,10 @@ class BaseModel(abc.ABC):
         return self._backend.fit_generator(
             generator=generator,
             epochs=epochs,
-            verbose=verbose, **kwargs
+            verbose=verbose,
+            workers=workers,
+            use_multiprocessing=use_multiprocessing,
+            **kwargs
         )
 
     def evaluate(
@@ -372,9 +383,12 @@ class BaseModel(abc.ABC):
             'pred': y_pred.squeeze()
         })
         assert isinstance(metric, engine.BaseMetric)
-        val = eval_df.groupby(by='id').apply(
-            lambda df: metric(df['true'].values, df['pred'].values)
-        ).mean()
+        y = eval_df['true'].values
+        y_pred = eval_df['pred'].values
+        groups = eval_df.groupby(by='id', sort=False).indices
+        val = pd.Series([
+            metric(y[rows], y_pred[rows]) for rows in groups.values()
+        ]).mean()
         return val
 
     def predict(
@@ -113,6 +113,7 @@ class StopRemovalUnit(ProcessorUnit):
         """Initialization."""
         self._lang = lang
         self._stop = nltk.corpus.stopwords.words(self._lang)
+        self._stop_set = frozenset(self._stop)
 
     def transform(self, tokens: list) -> list:
         """
@@ -123,10 +124,13 @@ class StopRemovalUnit(ProcessorUnit):
 
         :return tokens: list of tokenized tokens without stopwords.
         """
+        if not hasattr(self, '_stop_set'):
+            # Units saved before the set was introduced only have `_stop`.
+            self._stop_set = frozenset(self._stop)
         return [token
                 for token
                 in tokens
-                if token not in self._stop]
+                if token not in self._stop_set]
 
     @property
     def stopwords(self) -> list:
@@ -1,2 +1,3 @@
 from .one_hot import one_hot
 from .tensor_type import TensorType
+from .get_row_positions import get_row_positions
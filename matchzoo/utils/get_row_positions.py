@@ -0,0 +1,27 @@
+"""Row positions of ids."""
+import numpy as np
+import pandas as pd
+
+
+def get_row_positions(index: pd.Index, ids: pd.Series) -> np.ndarray:
+    """
+    Encode `ids` as int32 row positions in `index`.
+
+    Example:
+        >>> index = pd.Index(['A', 'B', 'C'], name='id_left')
+        >>> get_row_positions(index, pd.Series(['C', 'A', 'C'])).tolist()
+        [2, 0, 2]
+        >>> get_row_positions(index, pd.Series(['A', 'D']))
+        Traceback (most recent call last):
+            ...
+        ValueError: Ids ['D'] not found in `id_left`.
+
+    :param index: index of the frame the ids refer to.
+    :param ids: ids to encode.
+    :return: position of each id in `index`.
+    """
+    rows = index.get_indexer(ids)
+    if (rows == -1).any():
+        missing = ids[rows == -1].unique().tolist()
+        raise ValueError(f"Ids {missing} not found in `{index.name}`.")
+    return rows.astype(np.int32)
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from matchzoo import DataPack
+from matchzoo.data_generator import DataGenerator
+
+
+def build_data_pack(text_left, text_right, relation=None):
+    if relation is None:
+        relation = [['qid0', 'did0', 1], ['qid1', 'did1', 0],
+                    ['qid0', 'did1', 0]]
+    relation = pd.DataFrame(relation, columns=['id_left', 'id_right', 'label'])
+    left = pd.DataFrame({'id_left': ['qid0', 'qid1'], 'text_left': text_left})
+    left.set_index('id_left', inplace=True)
+    right = pd.DataFrame({'id_right': ['did0', 'did1'],
+                          'text_right': text_right})
+    right.set_index('id_right', inplace=True)
+    return DataPack(relation=relation, left=left, right=right)
+
+
+@pytest.fixture
+def data_pack():
+    return build_data_pack([[1, 2], [2, 3]], [[2, 3, 4], [3, 4, 5]])
+
+
+@pytest.mark.parametrize('relation', [
+    [['qid0', 'did0', 1], ['qid2', 'did1', 0]],
+    [['qid0', 'did0', 1], ['qid1', 'did2', 0]],
+])
+def test_missing_id(relation):
+    data_pack = build_data_pack([[1, 2], [2, 3]], [[2, 3, 4], [3, 4, 5]],
+                                relation)
+    with pytest.raises(ValueError):
+        DataGenerator(data_pack, batch_size=2, shuffle=False)
+
+
+def test_ragged_columns():
+    data_pack = build_data_pack([[1, 2], [2]], [[2, 3, 4], [3, 4, 5]])
+    x, _ = DataGenerator(data_pack, batch_size=3, shuffle=False)[0]
+    assert x['text_left'].dtype == object
+    assert x['text_left'].tolist() == [[1, 2], [2], [1, 2]]
+    assert x['text_right'].shape == (3, 3)
+
+
+def test_fixed_length_columns(data_pack):
+    x, _ = DataGenerator(data_pack, batch_size=3, shuffle=False)[0]
+    assert x['text_left'].dtype == np.int32
+    assert x['text_right'].dtype == np.int32
+    assert x['text_left'].flags['C_CONTIGUOUS']
+
+
+def test_extra_relation_columns(data_pack):
+    data_pack.relation['weight'] = [0.5, 1.0, 2.0]
+    x, _ = DataGenerator(data_pack, batch_size=3, shuffle=False)[0]
+    assert x['weight'].tolist() == [0.5, 1.0, 2.0]
+
+
+@pytest.mark.parametrize('with_label', [True, False])
+def test_batch_matches_unpack(data_pack, with_label):
+    if not with_label:
+        data_pack.relation.drop(columns='label', inplace=True)
+    generator = DataGenerator(data_pack, batch_size=2, shuffle=True)
+    for i, indices in enumerate(generator._batch_indices):
+        x, y = generator[i]
+        expected_x, expected_y = data_pack[indices].unpack()
+        assert list(x.keys()) == list(expected_x.keys())
+        for key in x:
+            assert np.array_equal(x[key].tolist(), expected_x[key].tolist())
+        if with_label:
+            assert np.array_equal(y, expected_y)
+        else:
+            assert y is None and expected_y is None
@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from matchzoo import DataPack
+from matchzoo.data_generator import PairDataGenerator
+
+
+@pytest.fixture
+def data_pack():
+    relation = [['qid0', 'did0', 2], ['qid0', 'did1', 1], ['qid0', 'did2', 0],
+                ['qid0', 'did3', 0], ['qid1', 'did0', 0], ['qid1', 'did1', 1],
+                ['qid1', 'did2', 0], ['qid2', 'did3', 0], ['qid2', 'did0', 0],
+                ['qid3', 'did1', 1]]
+    left = [['qid0', [1, 2]], ['qid1', [2, 3]], ['qid2', [3, 4]],
+            ['qid3', [4, 5]]]
+    right = [['did0', [2, 3, 4]], ['did1', [3, 4, 5]], ['did2', [4, 5, 6]],
+             ['did3', [5, 6, 7]]]
+    relation = pd.DataFrame(relation, columns=['id_left', 'id_right', 'label'])
+    left = pd.DataFrame(left, columns=['id_left', 'text_left'])
+    left.set_index('id_left', inplace=True)
+    right = pd.DataFrame(right, columns=['id_right', 'text_right'])
+    right.set_index('id_right', inplace=True)
+    return DataPack(relation=relation,
+                    left=left,
+                    right=right)
+
+
+@pytest.mark.parametrize('dtype', ['int64', 'uint8', 'bool'])
+@pytest.mark.parametrize('num_dup,num_neg', [(1, 1), (2, 3)])
+def test_reorganize_data_pack(data_pack, num_dup, num_neg, dtype):
+    relation = data_pack.relation
+    relation['label'] = relation['label'].astype(dtype)
+    min_label = relation.groupby('id_left')['label'].transform('min')
+    num_pos = (relation['label'] > min_label).sum() * num_dup
+
+    reorganized = PairDataGenerator.reorganize_data_pack(
+        data_pack, num_dup, num_neg).relation
+    assert len(reorganized) == num_pos * (num_neg + 1)
+    for start in range(0, len(reorganized), num_neg + 1):
+        block = reorganized.iloc[start: start + num_neg + 1]
+        assert block['id_left'].nunique() == 1
+        assert (block['label'].iloc[0] > block['label'].iloc[1:]).all()
+
+
+def test_pair_batch(data_pack):
+    generator = PairDataGenerator(data_pack, num_dup=1, num_neg=2,
+                                  batch_size=2, shuffle=False)
+    assert generator.num_instance == 3
+    x, y = generator[0]
+    assert x['id_left'].tolist() == ['qid0'] * 3 + ['qid0'] * 3
+    assert (y[0] > y[1:3]).all() and (y[3] > y[4:6]).all()
@@ -58,6 +58,14 @@ def test_stopremoval_unit(list_input):
     assert 'the' not in out
 
 
+def test_stopremoval_unit_without_stop_set(list_input):
+    # Units saved by earlier versions only carry the stopwords list.
+    su = StopRemovalUnit.__new__(StopRemovalUnit)
+    su.__dict__.update({'_lang': 'english', '_stop': ['a', 'the']})
+    out = su.transform(list_input)
+    assert out == ['this', 'Is', 'test', 'lIst', '36', '!', 'input']
+
+
 def test_stemming_unit(list_input):
     su_porter = StemmingUnit()
     out_porter = su_porter.transform(list_input)
@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 import pytest
 
 import matchzoo as mz
@@ -17,3 +19,13 @@ def test_embedding(term_index):
     assert matrix.shape == (len(term_index) + 1, 10)
     assert embed.input_dim == 5
 
+
+def test_embedding_with_duplicated_index():
+    data = pd.DataFrame(data=[[0, 1], [2, 3], [4, 5], [6, 7]],
+                        index=['A', np.nan, 'B', np.nan])
+    embed = mz.embedding.Embedding(data)
+    matrix = embed.build_matrix({'A': 2, 'B': 1, 'C': 3})
+    assert matrix.shape == (4, 2)
+    assert (matrix[2] == [0, 1]).all()
+    assert (matrix[1] == [4, 5]).all()
+    assert ((-0.2 <= matrix[3]) & (matrix[3] <= 0.2)).all()